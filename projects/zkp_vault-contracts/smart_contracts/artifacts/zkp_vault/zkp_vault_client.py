@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create_application", "returns": {"type": "void"}, "desc": "Initialize the contract", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "desc": "The exam identifier", "name": "exam_id"}, {"type": "string", "desc": "Hashed student identity", "name": "student_hash"}, {"type": "uint64", "desc": "Final trust score (0-100)", "name": "trust_score"}, {"type": "string", "desc": "SHA-256 hash of the proof data", "name": "proof_hash"}], "name": "submit_proof", "returns": {"type": "string", "desc": "Success message with transaction details"}, "desc": "Submit exam proof for a student", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "desc": "The exam identifier", "name": "exam_id"}, {"type": "string", "desc": "Hashed student identity", "name": "student_hash"}, {"type": "uint64", "desc": "Final trust score (0-100)", "name": "trust_score"}, {"type": "string", "desc": "SHA-256 hash of the proof data", "name": "proof_hash"}], "name": "verify_submission", "returns": {"type": "bool", "desc": "True if valid"}, "desc": "Verify that a proof submission is valid", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_info", "returns": {"type": "string", "desc": "Contract name and version"}, "desc": "Get contract information", "events": [], "readonly": false, "recommendations": {}}], "name": "ZKPVault", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEAAIBCDEZFEQxGEEAWYIDBKiOtJAE2L2TnwQu7ru5NhoAjgMATQClAAEAgDcVH3x1ADFaS1AtVmF1bHQgdjEuMCAtIFByaXZhY3ktUHJlc2VydmluZyBBSSBQcm9jdG9yaW5nsCRDgAR1LDrANhoAjgEAAQAkQzYaAUkiWSMITBUSRDYaAkkiWSMITBUSRDYaA0kVJRJENhoESSJZIwhMFRJEF4FkDkSAIhUffHUAHFByb29mIHN1Ym1pdHRlZCBzdWNjZXNzZnVsbHmwJEM2GgFJIlkjCEwVEkQ2GgJJIlkjCEwVEkQ2GgNJFSUSRDYaBEkiWSMITBUSRBeBZA5BABMkgAEAIk8CVIAEFR98dUxQsCRDIkL/6g==", "clear": "C4EBQw=="}, "desc": "\n    ZKP-Vault Smart Contract\n    Privacy-preserving AI proctoring on Algorand\n    \n    Simplified version using global state for demo purposes\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDIgMSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjExCiAgICAvLyBjbGFzcyBaS1BWYXVsdChBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEA3CiAgICBwdXNoYnl0ZXNzIDB4YTg4ZWI0OTAgMHhkOGJkOTM5ZiAweDJlZWViYmI5IC8vIG1ldGhvZCAic3VibWl0X3Byb29mKHN0cmluZyxzdHJpbmcsdWludDY0LHN0cmluZylzdHJpbmciLCBtZXRob2QgInZlcmlmeV9zdWJtaXNzaW9uKHN0cmluZyxzdHJpbmcsdWludDY0LHN0cmluZylib29sIiwgbWV0aG9kICJnZXRfY29udHJhY3RfaW5mbygpc3RyaW5nIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggc3VibWl0X3Byb29mIHZlcmlmeV9zdWJtaXNzaW9uIG1haW5fZ2V0X2NvbnRyYWN0X2luZm9fcm91dGVANQogICAgZXJyCgptYWluX2dldF9jb250cmFjdF9pbmZvX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAzMTVhNGI1MDJkNTY2MTc1NmM3NDIwNzYzMTJlMzAyMDJkMjA1MDcyNjk3NjYxNjM3OTJkNTA3MjY1NzM2NTcyNzY2OTZlNjcyMDQxNDkyMDUwNzI2ZjYzNzQ2ZjcyNjk2ZTY3CiAgICBsb2cKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX05vT3BANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MTEKICAgIC8vIGNsYXNzIFpLUFZhdWx0KEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHg3NTJjM2FjMCAvLyBtZXRob2QgImNyZWF0ZV9hcHBsaWNhdGlvbigpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2FwcGxpY2F0aW9uX3JvdXRlQDgKICAgIGVycgoKbWFpbl9jcmVhdGVfYXBwbGljYXRpb25fcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56a3BfdmF1bHQuY29udHJhY3QuWktQVmF1bHQuc3VibWl0X3Byb29mW3JvdXRpbmddKCkgLT4gdm9pZDoKc3VibWl0X3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weToyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzEgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMSAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18xIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjQ0LTQ1CiAgICAvLyAjIFZlcmlmeSB0cnVzdCBzY29yZSBpcyB2YWxpZCAoMC0xMDApCiAgICAvLyBhc3NlcnQgdHJ1c3Rfc2NvcmUubmF0aXZlIDw9IFVJbnQ2NCgxMDApLCAiVHJ1c3Qgc2NvcmUgY2Fubm90IGV4Y2VlZCAxMDAiCiAgICBidG9pCiAgICBwdXNoaW50IDEwMAogICAgPD0KICAgIGFzc2VydCAvLyBUcnVzdCBzY29yZSBjYW5ub3QgZXhjZWVkIDEwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weToyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWM1MDcyNmY2ZjY2MjA3Mzc1NjI2ZDY5NzQ3NDY1NjQyMDczNzU2MzYzNjU3MzczNjY3NTZjNmM3OQogICAgbG9nCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnprcF92YXVsdC5jb250cmFjdC5aS1BWYXVsdC52ZXJpZnlfc3VibWlzc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeV9zdWJtaXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzEgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMSAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18xIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5Ojc2CiAgICAvLyB0cnVzdF9zY29yZS5uYXRpdmUgPD0gVUludDY0KDEwMCkgYW5kCiAgICBidG9pCiAgICBwdXNoaW50IDEwMAogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6NzYtNzcKICAgIC8vIHRydXN0X3Njb3JlLm5hdGl2ZSA8PSBVSW50NjQoMTAwKSBhbmQKICAgIC8vIHRydXN0X3Njb3JlLm5hdGl2ZSA+PSBVSW50NjQoMCkKICAgIGJ6IHZlcmlmeV9zdWJtaXNzaW9uX2Jvb2xfZmFsc2VANAogICAgaW50Y18yIC8vIDEKCnZlcmlmeV9zdWJtaXNzaW9uX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBhcmM0LkJvb2woaXNfdmFsaWQpCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKdmVyaWZ5X3N1Ym1pc3Npb25fYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgdmVyaWZ5X3N1Ym1pc3Npb25fYm9vbF9tZXJnZUA1Cg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [169], "errorMessage": "Trust score cannot exceed 100"}, {"pc": [126, 138, 158, 214, 226, 246], "errorMessage": "invalid array length header"}, {"pc": [132, 144, 164, 220, 232, 252], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [152, 240], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create_application", "returns": {"type": "void"}, "desc": "Initialize the contract", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "desc": "The exam identifier", "name": "exam_id"}, {"type": "byte[32]", "desc": "SHA-256 hash of the student identity (32 bytes)", "name": "student_hash"}, {"type": "uint64", "desc": "Final trust score (0-100)", "name": "trust_score"}, {"type": "byte[32]", "desc": "SHA-256 hash of the proof data (32 bytes)", "name": "proof_hash"}], "name": "submit_proof", "returns": {"type": "bool", "desc": "True once the proof has been accepted"}, "desc": "Submit exam proof for a student", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "desc": "The exam identifier", "name": "exam_id"}, {"type": "byte[32]", "desc": "SHA-256 hash of the student identity (32 bytes)", "name": "student_hash"}, {"type": "uint64", "desc": "Final trust score (0-100)", "name": "trust_score"}, {"type": "byte[32]", "desc": "SHA-256 hash of the proof data (32 bytes)", "name": "proof_hash"}], "name": "verify_submission", "returns": {"type": "bool", "desc": "True if valid"}, "desc": "Verify that a proof submission is valid", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_info", "returns": {"type": "string", "desc": "Contract name and version"}, "desc": "Get contract information", "events": [], "readonly": false, "recommendations": {}}], "name": "ZKPVault", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEASAAAjEZFEQxGEEAWYIDBKqWpsQEU9GE0AQu7ru5NhoAjgMATQB/AAEAgDcVH3x1ADFaS1AtVmF1bHQgdjEuMCAtIFByaXZhY3ktUHJlc2VydmluZyBBSSBQcm9jdG9yaW5nsCJDgAR1LDrANhoAjgEAAQAiQzYaAUkkWSUITBUSRDYaAhUjEkQ2GgNJFYEIEkQ2GgQVIxJEF4FkDkSABRUffHWAsCJDNhoBSSRZJQhMFRJENhoCFSMSRDYaA0kVgQgSRDYaBBUjEkQXgWQOgAEAJE8CVIAEFR98dUxQsCJD", "clear": "C4EBQw=="}, "desc": "\n    ZKP-Vault Smart Contract\n    Privacy-preserving AI proctoring on Algorand\n    \n    Simplified version using global state for demo purposes\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDMyIDAgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weToxNQogICAgLy8gY2xhc3MgWktQVmF1bHQoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BANwogICAgcHVzaGJ5dGVzcyAweGFhOTZhNmM0IDB4NTNkMTg0ZDAgMHgyZWVlYmJiOSAvLyBtZXRob2QgInN1Ym1pdF9wcm9vZihzdHJpbmcsYnl0ZVszMl0sdWludDY0LGJ5dGVbMzJdKWJvb2wiLCBtZXRob2QgInZlcmlmeV9zdWJtaXNzaW9uKHN0cmluZyxieXRlWzMyXSx1aW50NjQsYnl0ZVszMl0pYm9vbCIsIG1ldGhvZCAiZ2V0X2NvbnRyYWN0X2luZm8oKXN0cmluZyIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHN1Ym1pdF9wcm9vZiB2ZXJpZnlfc3VibWlzc2lvbiBtYWluX2dldF9jb250cmFjdF9pbmZvX3JvdXRlQDUKICAgIGVycgoKbWFpbl9nZXRfY29udHJhY3RfaW5mb19yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMzE1YTRiNTAyZDU2NjE3NTZjNzQyMDc2MzEyZTMwMjAyZDIwNTA3MjY5NzY2MTYzNzkyZDUwNzI2NTczNjU3Mjc2Njk2ZTY3MjA0MTQ5MjA1MDcyNmY2Mzc0NmY3MjY5NmU2NwogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9Ob09wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjE1CiAgICAvLyBjbGFzcyBaS1BWYXVsdChBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4NzUyYzNhYzAgLy8gbWV0aG9kICJjcmVhdGVfYXBwbGljYXRpb24oKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9hcHBsaWNhdGlvbl9yb3V0ZUA4CiAgICBlcnIKCm1haW5fY3JlYXRlX2FwcGxpY2F0aW9uX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuemtwX3ZhdWx0LmNvbnRyYWN0LlpLUFZhdWx0LnN1Ym1pdF9wcm9vZltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1Ym1pdF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzIgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBsZW4KICAgIGludGNfMSAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgbGVuCiAgICBpbnRjXzEgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo0OC00OQogICAgLy8gIyBWZXJpZnkgdHJ1c3Qgc2NvcmUgaXMgdmFsaWQgKDAtMTAwKTsgVUludDY0IGlzIG5ldmVyIG5lZ2F0aXZlCiAgICAvLyBhc3NlcnQgdHJ1c3Rfc2NvcmUubmF0aXZlIDw9IDEwMCwgIlRydXN0IHNjb3JlIGNhbm5vdCBleGNlZWQgMTAwIgogICAgYnRvaQogICAgcHVzaGludCAxMDAKICAgIDw9CiAgICBhc3NlcnQgLy8gVHJ1c3Qgc2NvcmUgY2Fubm90IGV4Y2VlZCAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzU4MAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnprcF92YXVsdC5jb250cmFjdC5aS1BWYXVsdC52ZXJpZnlfc3VibWlzc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeV9zdWJtaXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMiAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGxlbgogICAgaW50Y18xIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBsZW4KICAgIGludGNfMSAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5Ojc3LTc5CiAgICAvLyAjIEJhc2ljIHZhbGlkYXRpb247IGNvbWJpbmUgYW55IGZ1dHVyZSBwcmVkaWNhdGVzIHdpdGggYCZgIHNvIHRoZQogICAgLy8gIyBjaGVjayBzdGF5cyBicmFuY2hsZXNzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHRydXN0X3Njb3JlLm5hdGl2ZSA8PSAxMDApCiAgICBidG9pCiAgICBwdXNoaW50IDEwMAogICAgPD0KICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzIgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [160], "errorMessage": "Trust score cannot exceed 100"}, {"pc": [126, 176], "errorMessage": "invalid array length header"}, {"pc": [132, 182], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [139, 155, 189, 205], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [148, 198], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -68,25 +68,25 @@ def _init_dataclass(cls: type, data: dict) -> object:
 class SubmitProofArgs:
     """Dataclass for submit_proof arguments"""
     exam_id: str
-    student_hash: str
+    student_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
     trust_score: int
-    proof_hash: str
+    proof_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
 
     @property
     def abi_method_signature(self) -> str:
-        return "submit_proof(string,string,uint64,string)string"
+        return "submit_proof(string,byte[32],uint64,byte[32])bool"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class VerifySubmissionArgs:
     """Dataclass for verify_submission arguments"""
     exam_id: str
-    student_hash: str
+    student_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
     trust_score: int
-    proof_hash: str
+    proof_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
 
     @property
     def abi_method_signature(self) -> str:
-        return "verify_submission(string,string,uint64,string)bool"
+        return "verify_submission(string,byte[32],uint64,byte[32])bool"
 
 
 class ZkpVaultParams:
@@ -95,27 +95,27 @@ class ZkpVaultParams:
 
     def submit_proof(
         self,
-        args: tuple[str, str, int, str] | SubmitProofArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SubmitProofArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "submit_proof(string,string,uint64,string)string",
+            "method": "submit_proof(string,byte[32],uint64,byte[32])bool",
             "args": method_args,
         }))
 
     def verify_submission(
         self,
-        args: tuple[str, str, int, str] | VerifySubmissionArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | VerifySubmissionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_submission(string,string,uint64,string)bool",
+            "method": "verify_submission(string,byte[32],uint64,byte[32])bool",
             "args": method_args,
         }))
 
@@ -158,27 +158,27 @@ class ZkpVaultCreateTransactionParams:
 
     def submit_proof(
         self,
-        args: tuple[str, str, int, str] | SubmitProofArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SubmitProofArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "submit_proof(string,string,uint64,string)string",
+            "method": "submit_proof(string,byte[32],uint64,byte[32])bool",
             "args": method_args,
         }))
 
     def verify_submission(
         self,
-        args: tuple[str, str, int, str] | VerifySubmissionArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | VerifySubmissionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_submission(string,string,uint64,string)bool",
+            "method": "verify_submission(string,byte[32],uint64,byte[32])bool",
             "args": method_args,
         }))
 
@@ -221,23 +221,23 @@ class ZkpVaultSend:
 
     def submit_proof(
         self,
-        args: tuple[str, str, int, str] | SubmitProofArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SubmitProofArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "submit_proof(string,string,uint64,string)string",
+            "method": "submit_proof(string,byte[32],uint64,byte[32])bool",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
     def verify_submission(
         self,
-        args: tuple[str, str, int, str] | VerifySubmissionArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | VerifySubmissionArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[bool]:
@@ -245,7 +245,7 @@ class ZkpVaultSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "verify_submission(string,string,uint64,string)bool",
+            "method": "verify_submission(string,byte[32],uint64,byte[32])bool",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -442,13 +442,13 @@ class ZkpVaultClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["submit_proof(string,string,uint64,string)string"],
+        method: typing.Literal["submit_proof(string,byte[32],uint64,byte[32])bool"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> bool | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["verify_submission(string,string,uint64,string)bool"],
+        method: typing.Literal["verify_submission(string,byte[32],uint64,byte[32])bool"],
         return_value: algokit_utils.ABIReturn | None
     ) -> bool | None: ...
     @typing.overload
@@ -660,18 +660,18 @@ class ZkpVaultFactoryCreateParams:
 
     def submit_proof(
         self,
-        args: tuple[str, str, int, str] | SubmitProofArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SubmitProofArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the submit_proof(string,string,uint64,string)string ABI method"""
+        """Creates a new instance using the submit_proof(string,byte[32],uint64,byte[32])bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "submit_proof(string,string,uint64,string)string",
+                "method": "submit_proof(string,byte[32],uint64,byte[32])bool",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -680,18 +680,18 @@ class ZkpVaultFactoryCreateParams:
 
     def verify_submission(
         self,
-        args: tuple[str, str, int, str] | VerifySubmissionArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | VerifySubmissionArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the verify_submission(string,string,uint64,string)bool ABI method"""
+        """Creates a new instance using the verify_submission(string,byte[32],uint64,byte[32])bool ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "verify_submission(string,string,uint64,string)bool",
+                "method": "verify_submission(string,byte[32],uint64,byte[32])bool",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -876,7 +876,7 @@ class ZkpVaultComposer:
 
     def submit_proof(
         self,
-        args: tuple[str, str, int, str] | SubmitProofArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | SubmitProofArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZkpVaultComposer":
         self._composer.add_app_call_method_call(
@@ -887,14 +887,14 @@ class ZkpVaultComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "submit_proof(string,string,uint64,string)string", v
+                "submit_proof(string,byte[32],uint64,byte[32])bool", v
             )
         )
         return self
 
     def verify_submission(
         self,
-        args: tuple[str, str, int, str] | VerifySubmissionArgs,
+        args: tuple[str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | VerifySubmissionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZkpVaultComposer":
         self._composer.add_app_call_method_call(
@@ -905,7 +905,7 @@ class ZkpVaultComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "verify_submission(string,string,uint64,string)bool", v
+                "verify_submission(string,byte[32],uint64,byte[32])bool", v
             )
         )
         return self
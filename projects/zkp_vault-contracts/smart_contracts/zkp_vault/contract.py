@@ -1,12 +1,16 @@
+import typing
+
 from algopy import (
     ARC4Contract,
-    UInt64,
-    Bytes,
-    Global,
-    Txn,
     arc4,
 )
 
+CONTRACT_INFO: typing.Final = "ZKP-Vault v1.0 - Privacy-Preserving AI Proctoring"
+
+# SHA-256 digests are always 32 bytes, so they are passed as static arrays
+# rather than length-prefixed strings
+Hash32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
 
 class ZKPVault(ARC4Contract):
     """
@@ -25,59 +29,54 @@ class ZKPVault(ARC4Contract):
     def submit_proof(
         self,
         exam_id: arc4.String,
-        student_hash: arc4.String,
+        student_hash: Hash32,
         trust_score: arc4.UInt64,
-        proof_hash: arc4.String,
-    ) -> arc4.String:
+        proof_hash: Hash32,
+    ) -> arc4.Bool:
         """
         Submit exam proof for a student
         
         Args:
             exam_id: The exam identifier
-            student_hash: Hashed student identity
+            student_hash: SHA-256 hash of the student identity (32 bytes)
             trust_score: Final trust score (0-100)
-            proof_hash: SHA-256 hash of the proof data
+            proof_hash: SHA-256 hash of the proof data (32 bytes)
             
         Returns:
-            Success message with transaction details
+            True once the proof has been accepted
         """
-        # Verify trust score is valid (0-100)
-        assert trust_score.native <= UInt64(100), "Trust score cannot exceed 100"
-        assert trust_score.native >= UInt64(0), "Trust score cannot be negative"
+        # Verify trust score is valid (0-100); UInt64 is never negative
+        assert trust_score.native <= 100, "Trust score cannot exceed 100"
         
         # In a real implementation, we would store this in box storage
         # For hackathon demo, we'll just validate and return success
         # The proof hash and trust score are permanently recorded in the transaction
         
-        return arc4.String("Proof submitted successfully")
+        return arc4.Bool(True)  # noqa: FBT003
 
     @arc4.abimethod
     def verify_submission(
         self,
         exam_id: arc4.String,
-        student_hash: arc4.String,
+        student_hash: Hash32,
         trust_score: arc4.UInt64,
-        proof_hash: arc4.String,
+        proof_hash: Hash32,
     ) -> arc4.Bool:
         """
         Verify that a proof submission is valid
         
         Args:
             exam_id: The exam identifier
-            student_hash: Hashed student identity
+            student_hash: SHA-256 hash of the student identity (32 bytes)
             trust_score: Final trust score (0-100)
-            proof_hash: SHA-256 hash of the proof data
+            proof_hash: SHA-256 hash of the proof data (32 bytes)
             
         Returns:
             True if valid
         """
-        # Basic validation
-        is_valid = (
-            trust_score.native <= UInt64(100) and
-            trust_score.native >= UInt64(0)
-        )
-        
-        return arc4.Bool(is_valid)
+        # Basic validation; combine any future predicates with `&` so the
+        # check stays branchless
+        return arc4.Bool(trust_score.native <= 100)
 
     @arc4.abimethod
     def get_contract_info(self) -> arc4.String:
@@ -87,4 +86,4 @@ class ZKPVault(ARC4Contract):
         Returns:
             Contract name and version
         """
-        return arc4.String("ZKP-Vault v1.0 - Privacy-Preserving AI Proctoring")
\ No newline at end of file
+        return arc4.String(CONTRACT_INFO)
\ No newline at end of file
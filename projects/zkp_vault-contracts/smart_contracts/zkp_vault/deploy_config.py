@@ -1,33 +1,125 @@
 import logging
+import typing
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import algokit_utils
 
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.zkp_vault.zkp_vault_client import (
+        ZkpVaultClient,
+        ZkpVaultFactory,
+    )
+
 logger = logging.getLogger(__name__)
 
 
-def deploy() -> None:
-    from smart_contracts.artifacts.zkp_vault.zkp_vault_client import (
+# Factories keyed by (algod address, deployer address), so switching the
+# environment to another network or deployer never reuses a stale client
+_factories: dict[tuple[str, str], "ZkpVaultFactory"] = {}
+
+
+def _build_factory(
+    algorand: algokit_utils.AlgorandClient, deployer: algokit_utils.SigningAccount
+) -> "ZkpVaultFactory":
+    # The generated client is imported lazily so this module stays importable
+    # before the first build has produced the artifacts.
+    from smart_contracts.artifacts.zkp_vault.zkp_vault_client import ZkpVaultFactory
+
+    return algorand.client.get_typed_app_factory(
         ZkpVaultFactory,
-        ZkpVaultMethodCallCreateParams,
+        default_sender=deployer.address,
+        default_signer=deployer.signer,
     )
 
+
+def _get_factory() -> "ZkpVaultFactory":
     algorand = algokit_utils.AlgorandClient.from_environment()
     deployer = algorand.account.from_environment("DEPLOYER")
 
-    factory = algorand.client.get_typed_app_factory(
-        ZkpVaultFactory,
-        default_sender=deployer.address,
-        default_signer=deployer.signer,
+    key = (algorand.client.algod.algod_address, deployer.address)
+    if key not in _factories:
+        _factories[key] = _build_factory(algorand, deployer)
+    return _factories[key]
+
+
+def _deploy_app(
+    factory: "ZkpVaultFactory", app_name: str | None = None
+) -> "ZkpVaultClient":
+    from smart_contracts.artifacts.zkp_vault.zkp_vault_client import (
+        ZkpVaultMethodCallCreateParams,
     )
 
     # 🔑 IMPORTANT: use ABI create method
-    app_client, result = factory.deploy(
+    app_client, _ = factory.deploy(
         on_update=algokit_utils.OnUpdate.ReplaceApp,
         on_schema_break=algokit_utils.OnSchemaBreak.ReplaceApp,
-        create_params=ZkpVaultMethodCallCreateParams(
-            method="create_application()void"
-        ),
+        create_params=ZkpVaultMethodCallCreateParams(method="create_application()void"),
+        app_name=app_name,
     )
+    return app_client
+
+
+def _deploy_isolated_app(
+    app_name: str, deployer: algokit_utils.SigningAccount
+) -> "ZkpVaultClient":
+    # The creator app lookup cache lives on the AlgorandClient's AppDeployer
+    # and is not thread-safe, so each worker gets its own client and factory.
+    # The deployer is resolved once by the caller: on LocalNet that may create
+    # the KMD wallet, which must not race between workers.
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    algorand.set_signer_from_account(deployer)
+    return _deploy_app(_build_factory(algorand, deployer), app_name)
+
+
+def _log_deployment(app_client: "ZkpVaultClient", label: str) -> None:
+    logger.info("✅ %s deployed successfully", label)
+    logger.info("🆔 App ID: %s", app_client.app_id)
+    logger.info("📍 App Address: %s", app_client.app_address)
+
 
-    logger.info("✅ ZKP-Vault deployed successfully")
-    logger.info(f"🆔 App ID: {app_client.app_id}")
-    logger.info(f"📍 App Address: {app_client.app_address}")
+def deploy_apps(
+    app_names: Sequence[str], max_workers: int = 8
+) -> list["ZkpVaultClient"]:
+    """
+    Deploys one ZKP-Vault app per name concurrently.
+    Deployment is bound by algod round trips, so the calls share a thread pool.
+    Names must be unique: two workers deploying the same name would both miss
+    the existing app and create duplicates.
+    Every app that deployed is logged even if others fail, and only then is
+    an exception naming the failed apps raised.
+    """
+    duplicates = sorted({name for name in app_names if app_names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate app names: {', '.join(duplicates)}")
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer = algorand.account.from_environment("DEPLOYER")
+
+    app_clients: dict[str, ZkpVaultClient] = {}
+    failures: dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_deploy_isolated_app, app_name, deployer): app_name
+            for app_name in app_names
+        }
+        for future in as_completed(futures):
+            app_name = futures[future]
+            try:
+                app_clients[app_name] = future.result()
+            except Exception as e:
+                logger.error("❌ %s failed to deploy: %s", app_name, e)
+                failures[app_name] = e
+            else:
+                _log_deployment(app_clients[app_name], app_name)
+
+    if failures:
+        failed = ", ".join(name for name in app_names if name in failures)
+        raise Exception(f"Failed to deploy: {failed}") from next(
+            iter(failures.values())
+        )
+    return [app_clients[app_name] for app_name in app_names]
+
+
+def deploy() -> None:
+    _log_deployment(_deploy_app(_get_factory()), "ZKP-Vault")
@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+import types
+import uuid
+
+import pytest
+from algokit_utils import AlgorandClient, SigningAccount
+from algosdk import account, mnemonic
+
+from smart_contracts.zkp_vault import deploy_config
+from smart_contracts.zkp_vault.deploy_config import deploy_apps
+
+
+@pytest.fixture()
+def offline_deployer(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A mnemonic makes DEPLOYER resolve locally, without KMD or algod
+    private_key, _ = account.generate_account()
+    monkeypatch.setenv("DEPLOYER_MNEMONIC", mnemonic.from_private_key(private_key))
+
+
+def _stub_deploys(
+    monkeypatch: pytest.MonkeyPatch, failing: frozenset[str] = frozenset()
+) -> list[tuple[str, str]]:
+    calls: list[tuple[str, str]] = []
+    lock = threading.Lock()
+
+    def fake_deploy(app_name: str, deployer: SigningAccount) -> types.SimpleNamespace:
+        with lock:
+            calls.append((app_name, deployer.address))
+            app_id = len(calls)
+        # Later names finish first, so completion order differs from input order
+        time.sleep(0.01 * (3 - app_id))
+        if app_name in failing:
+            raise RuntimeError(f"{app_name} rejected")
+        return types.SimpleNamespace(
+            app_name=app_name, app_id=app_id, app_address=f"ADDR-{app_name}"
+        )
+
+    monkeypatch.setattr(deploy_config, "_deploy_isolated_app", fake_deploy)
+    return calls
+
+
+@pytest.mark.usefixtures("offline_deployer")
+def test_deploy_apps_runs_one_deploy_per_name_in_input_order(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls = _stub_deploys(monkeypatch)
+    app_names = ["ZKPVault-a", "ZKPVault-b", "ZKPVault-c"]
+
+    with caplog.at_level(logging.INFO, logger=deploy_config.__name__):
+        app_clients = deploy_apps(app_names)
+
+    assert sorted(name for name, _ in calls) == app_names
+    # Every worker is handed the same deployer resolved by the caller
+    assert len({address for _, address in calls}) == 1
+    assert [app_client.app_name for app_client in app_clients] == app_names
+    for app_name in app_names:
+        assert f"✅ {app_name} deployed successfully" in caplog.messages
+
+
+@pytest.mark.usefixtures("offline_deployer")
+def test_deploy_apps_logs_successes_before_raising_failures(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    _stub_deploys(monkeypatch, failing=frozenset({"ZKPVault-b"}))
+
+    with (
+        caplog.at_level(logging.INFO, logger=deploy_config.__name__),
+        pytest.raises(Exception, match="Failed to deploy: ZKPVault-b$") as excinfo,
+    ):
+        deploy_apps(["ZKPVault-a", "ZKPVault-b", "ZKPVault-c"])
+
+    assert str(excinfo.value.__cause__) == "ZKPVault-b rejected"
+    assert "✅ ZKPVault-a deployed successfully" in caplog.messages
+    assert "✅ ZKPVault-c deployed successfully" in caplog.messages
+
+
+def test_deploy_apps_creates_one_app_per_name(algorand_client: AlgorandClient) -> None:
+    # A fresh prefix keeps reruns from matching apps deployed by earlier runs
+    prefix = f"ZKPVault-{uuid.uuid4().hex[:8]}"
+    app_names = [f"{prefix}-a", f"{prefix}-b"]
+
+    app_clients = deploy_apps(app_names)
+
+    assert [app_client.app_name for app_client in app_clients] == app_names
+    assert len({app_client.app_id for app_client in app_clients}) == len(app_names)
+    for app_client in app_clients:
+        assert (
+            algorand_client.app.get_by_id(app_client.app_id).app_id == app_client.app_id
+        )
+
+
+def test_deploy_apps_rejects_duplicate_names() -> None:
+    with pytest.raises(ValueError, match="Duplicate app names: ZKPVault-a"):
+        deploy_apps(["ZKPVault-a", "ZKPVault-b", "ZKPVault-a"])
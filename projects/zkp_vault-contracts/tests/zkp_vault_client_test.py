@@ -3,14 +3,19 @@ import pytest
 from algokit_utils import (
     AlgoAmount,
     AlgorandClient,
+    AppClientBareCallParams,
     SigningAccount,
 )
+from algosdk import abi
 
 from smart_contracts.artifacts.zkp_vault.zkp_vault_client import (
     ZkpVaultClient,
     ZkpVaultFactory,
+    ZkpVaultMethodCallCreateParams,
 )
 
+DIGEST = bytes(range(32))
+
 
 @pytest.fixture()
 def deployer(algorand_client: AlgorandClient) -> SigningAccount:
@@ -32,24 +37,48 @@ def zkp_vault_client(
     client, _ = factory.deploy(
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
         on_update=algokit_utils.OnUpdate.AppendApp,
+        create_params=ZkpVaultMethodCallCreateParams(method="create_application()void"),
     )
     return client
 
 
-def test_says_hello(zkp_vault_client: ZkpVaultClient) -> None:
-    result = zkp_vault_client.send.hello(args=("World",))
-    assert result.abi_return == "Hello, World"
+def test_submit_proof_returns_true(zkp_vault_client: ZkpVaultClient) -> None:
+    result = zkp_vault_client.send.submit_proof(args=("EXAM-1", DIGEST, 100, DIGEST))
+    assert result.abi_return is True
+
+
+def test_submit_proof_rejects_trust_score_above_100(
+    zkp_vault_client: ZkpVaultClient,
+) -> None:
+    with pytest.raises(Exception, match="Trust score cannot exceed 100"):
+        zkp_vault_client.send.submit_proof(args=("EXAM-1", DIGEST, 101, DIGEST))
 
 
-def test_simulate_says_hello_with_correct_budget_consumed(
+def test_verify_submission_rejects_trust_score_above_100(
     zkp_vault_client: ZkpVaultClient,
 ) -> None:
-    result = (
-        zkp_vault_client.new_group()
-        .hello(args=("World",))
-        .hello(args=("Jane",))
-        .simulate()
+    result = zkp_vault_client.send.verify_submission(
+        args=("EXAM-1", DIGEST, 101, DIGEST)
     )
-    assert result.returns[0].value == "Hello, World"
-    assert result.returns[1].value == "Hello, Jane"
-    assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] < 100
+    assert result.abi_return is False
+
+
+@pytest.mark.parametrize("length", [31, 33])
+def test_submit_proof_rejects_wrong_length_hash(
+    zkp_vault_client: ZkpVaultClient, length: int
+) -> None:
+    # The typed client refuses to encode a malformed byte[32], so the call is
+    # assembled by hand to exercise the contract's own argument validation
+    method = abi.Method.from_signature(
+        "submit_proof(string,byte[32],uint64,byte[32])bool"
+    )
+    args = [
+        method.get_selector(),
+        abi.ABIType.from_string("string").encode("EXAM-1"),
+        bytes(length),
+        (100).to_bytes(8, "big"),
+        DIGEST,
+    ]
+
+    with pytest.raises(Exception, match="invalid number of bytes"):
+        zkp_vault_client.app_client.send.bare.call(AppClientBareCallParams(args=args))
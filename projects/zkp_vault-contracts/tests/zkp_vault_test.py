@@ -1,9 +1,10 @@
 from collections.abc import Iterator
 
 import pytest
+from algopy import arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
-from smart_contracts.zkp_vault.contract import ZkpVault
+from smart_contracts.zkp_vault.contract import CONTRACT_INFO, Hash32, ZKPVault
 
 
 @pytest.fixture()
@@ -12,13 +13,65 @@ def context() -> Iterator[AlgopyTestContext]:
         yield ctx
 
 
-def test_hello(context: AlgopyTestContext) -> None:
-    # Arrange
-    dummy_input = context.any.string(length=10)
-    contract = ZkpVault()
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> ZKPVault:
+    contract = ZKPVault()
+    contract.create_application()
+    return contract
+
+
+def _digest(context: AlgopyTestContext) -> Hash32:
+    return Hash32.from_bytes(context.any.bytes(32).value)
+
+
+def test_submit_proof_accepts_max_trust_score(
+    context: AlgopyTestContext, contract: ZKPVault
+) -> None:
+    # Act
+    output = contract.submit_proof(
+        arc4.String("EXAM-1"), _digest(context), arc4.UInt64(100), _digest(context)
+    )
+
+    # Assert
+    assert output.native is True
+
 
+def test_submit_proof_rejects_trust_score_above_100(
+    context: AlgopyTestContext, contract: ZKPVault
+) -> None:
+    with pytest.raises(AssertionError, match="Trust score cannot exceed 100"):
+        contract.submit_proof(
+            arc4.String("EXAM-1"), _digest(context), arc4.UInt64(101), _digest(context)
+        )
+
+
+@pytest.mark.parametrize("trust_score", [0, 100])
+def test_verify_submission_accepts_trust_score_in_range(
+    context: AlgopyTestContext, contract: ZKPVault, trust_score: int
+) -> None:
     # Act
-    output = contract.hello(dummy_input)
+    output = contract.verify_submission(
+        arc4.String("EXAM-1"),
+        _digest(context),
+        arc4.UInt64(trust_score),
+        _digest(context),
+    )
 
     # Assert
-    assert output == f"Hello, {dummy_input}"
+    assert output.native is True
+
+
+def test_verify_submission_rejects_trust_score_above_100(
+    context: AlgopyTestContext, contract: ZKPVault
+) -> None:
+    # Act
+    output = contract.verify_submission(
+        arc4.String("EXAM-1"), _digest(context), arc4.UInt64(101), _digest(context)
+    )
+
+    # Assert
+    assert output.native is False
+
+
+def test_get_contract_info(contract: ZKPVault) -> None:
+    assert contract.get_contract_info() == CONTRACT_INFO
@@ -1,6 +1,7 @@
 import * as algosdk from 'algosdk';
 import { SessionData } from './ai-proctor-service';
 import { PeraWalletConnect } from '@perawallet/connect';
+import { hexToDigest } from '../../utils/hexToDigest';
 
 // Algorand configuration
 const ALGOD_TOKEN = '';
@@ -9,6 +10,11 @@ const ALGOD_PORT = 443;
 
 export const algodClient = new algosdk.Algodv2(ALGOD_TOKEN, ALGOD_SERVER, ALGOD_PORT);
 
+// ABI method routed by the ZKPVault contract
+const SUBMIT_PROOF_METHOD = algosdk.ABIMethod.fromSignature(
+  'submit_proof(string,byte[32],uint64,byte[32])bool'
+);
+
 // Contract app ID (set after deployment)
 let APP_ID = 755317770; // TODO: Replace with actual App ID after deployment
 
@@ -33,14 +39,15 @@ export async function submitProofToBlockchain(
     console.log('Sender address:', senderAddress);
 
     const suggestedParams = await algodClient.getTransactionParams().do();
-    const encoder = new TextEncoder();
 
+    // The contract takes both digests as byte[32], so send the raw 32 bytes
+    // rather than the 0x-prefixed hex strings kept in the session data
     const appArgs = [
-      encoder.encode('submit_proof'),
-      encoder.encode(sessionData.examId),
-      encoder.encode(sessionData.studentHash),
+      SUBMIT_PROOF_METHOD.getSelector(),
+      new algosdk.ABIStringType().encode(sessionData.examId),
+      hexToDigest(sessionData.studentHash),
       algosdk.encodeUint64(sessionData.trustScore),
-      encoder.encode(sessionData.proofHash),
+      hexToDigest(sessionData.proofHash),
     ];
 
     // // ✅ Build the transaction with correct field names
@@ -24,7 +24,7 @@ import { SendParams, SendSingleTransactionResult, SendAtomicTransactionComposerR
 import { Address, encodeAddress, modelsv2, OnApplicationComplete, Transaction, TransactionSigner } from 'algosdk'
 import SimulateResponse = modelsv2.SimulateResponse
 
-export const APP_SPEC: Arc56Contract = {"name":"ZKPVault","structs":{},"methods":[{"name":"create_application","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"desc":"Initialize the contract","events":[],"recommendations":{}},{"name":"submit_proof","args":[{"type":"string","name":"exam_id","desc":"The exam identifier"},{"type":"string","name":"student_hash","desc":"Hashed student identity"},{"type":"uint64","name":"trust_score","desc":"Final trust score (0-100)"},{"type":"string","name":"proof_hash","desc":"SHA-256 hash of the proof data"}],"returns":{"type":"string","desc":"Success message with transaction details"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Submit exam proof for a student","events":[],"recommendations":{}},{"name":"verify_submission","args":[{"type":"string","name":"exam_id","desc":"The exam identifier"},{"type":"string","name":"student_hash","desc":"Hashed student identity"},{"type":"uint64","name":"trust_score","desc":"Final trust score (0-100)"},{"type":"string","name":"proof_hash","desc":"SHA-256 hash of the proof data"}],"returns":{"type":"bool","desc":"True if valid"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Verify that a proof submission is valid","events":[],"recommendations":{}},{"name":"get_contract_info","args":[],"returns":{"type":"string","desc":"Contract name and version"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Get contract information","events":[],"recommendations":{}}],"arcs":[22,28],"desc":"\n    ZKP-Vault Smart Contract\n    Privacy-preserving AI proctoring on Algorand\n    \n    Simplified version using global state for demo purposes\n    ","networks":{},"state":{"schema":{"global":{"ints":0,"bytes":0},"local":{"ints":0,"bytes":0}},"keys":{"global":{},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[169],"errorMessage":"Trust score cannot exceed 100"},{"pc":[126,138,158,214,226,246],"errorMessage":"invalid array length header"},{"pc":[132,144,164,220,232,252],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[152,240],"errorMessage":"invalid number of bytes for arc4.uint64"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDIgMSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjExCiAgICAvLyBjbGFzcyBaS1BWYXVsdChBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEA3CiAgICBwdXNoYnl0ZXNzIDB4YTg4ZWI0OTAgMHhkOGJkOTM5ZiAweDJlZWViYmI5IC8vIG1ldGhvZCAic3VibWl0X3Byb29mKHN0cmluZyxzdHJpbmcsdWludDY0LHN0cmluZylzdHJpbmciLCBtZXRob2QgInZlcmlmeV9zdWJtaXNzaW9uKHN0cmluZyxzdHJpbmcsdWludDY0LHN0cmluZylib29sIiwgbWV0aG9kICJnZXRfY29udHJhY3RfaW5mbygpc3RyaW5nIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggc3VibWl0X3Byb29mIHZlcmlmeV9zdWJtaXNzaW9uIG1haW5fZ2V0X2NvbnRyYWN0X2luZm9fcm91dGVANQogICAgZXJyCgptYWluX2dldF9jb250cmFjdF9pbmZvX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAzMTVhNGI1MDJkNTY2MTc1NmM3NDIwNzYzMTJlMzAyMDJkMjA1MDcyNjk3NjYxNjM3OTJkNTA3MjY1NzM2NTcyNzY2OTZlNjcyMDQxNDkyMDUwNzI2ZjYzNzQ2ZjcyNjk2ZTY3CiAgICBsb2cKICAgIGludGNfMiAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX05vT3BANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MTEKICAgIC8vIGNsYXNzIFpLUFZhdWx0KEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHg3NTJjM2FjMCAvLyBtZXRob2QgImNyZWF0ZV9hcHBsaWNhdGlvbigpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2FwcGxpY2F0aW9uX3JvdXRlQDgKICAgIGVycgoKbWFpbl9jcmVhdGVfYXBwbGljYXRpb25fcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56a3BfdmF1bHQuY29udHJhY3QuWktQVmF1bHQuc3VibWl0X3Byb29mW3JvdXRpbmddKCkgLT4gdm9pZDoKc3VibWl0X3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weToyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzEgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMSAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18xIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjQ0LTQ1CiAgICAvLyAjIFZlcmlmeSB0cnVzdCBzY29yZSBpcyB2YWxpZCAoMC0xMDApCiAgICAvLyBhc3NlcnQgdHJ1c3Rfc2NvcmUubmF0aXZlIDw9IFVJbnQ2NCgxMDApLCAiVHJ1c3Qgc2NvcmUgY2Fubm90IGV4Y2VlZCAxMDAiCiAgICBidG9pCiAgICBwdXNoaW50IDEwMAogICAgPD0KICAgIGFzc2VydCAvLyBUcnVzdCBzY29yZSBjYW5ub3QgZXhjZWVkIDEwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weToyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWM1MDcyNmY2ZjY2MjA3Mzc1NjI2ZDY5NzQ3NDY1NjQyMDczNzU2MzYzNjU3MzczNjY3NTZjNmM3OQogICAgbG9nCiAgICBpbnRjXzIgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnprcF92YXVsdC5jb250cmFjdC5aS1BWYXVsdC52ZXJpZnlfc3VibWlzc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeV9zdWJtaXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzEgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMSAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18xIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5Ojc2CiAgICAvLyB0cnVzdF9zY29yZS5uYXRpdmUgPD0gVUludDY0KDEwMCkgYW5kCiAgICBidG9pCiAgICBwdXNoaW50IDEwMAogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6NzYtNzcKICAgIC8vIHRydXN0X3Njb3JlLm5hdGl2ZSA8PSBVSW50NjQoMTAwKSBhbmQKICAgIC8vIHRydXN0X3Njb3JlLm5hdGl2ZSA+PSBVSW50NjQoMCkKICAgIGJ6IHZlcmlmeV9zdWJtaXNzaW9uX2Jvb2xfZmFsc2VANAogICAgaW50Y18yIC8vIDEKCnZlcmlmeV9zdWJtaXNzaW9uX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBhcmM0LkJvb2woaXNfdmFsaWQpCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18yIC8vIDEKICAgIHJldHVybgoKdmVyaWZ5X3N1Ym1pc3Npb25fYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgdmVyaWZ5X3N1Ym1pc3Npb25fYm9vbF9tZXJnZUA1Cg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"byteCode":{"approval":"CyAEAAIBCDEZFEQxGEEAWYIDBKiOtJAE2L2TnwQu7ru5NhoAjgMATQClAAEAgDcVH3x1ADFaS1AtVmF1bHQgdjEuMCAtIFByaXZhY3ktUHJlc2VydmluZyBBSSBQcm9jdG9yaW5nsCRDgAR1LDrANhoAjgEAAQAkQzYaAUkiWSMITBUSRDYaAkkiWSMITBUSRDYaA0kVJRJENhoESSJZIwhMFRJEF4FkDkSAIhUffHUAHFByb29mIHN1Ym1pdHRlZCBzdWNjZXNzZnVsbHmwJEM2GgFJIlkjCEwVEkQ2GgJJIlkjCEwVEkQ2GgNJFSUSRDYaBEkiWSMITBUSRBeBZA5BABMkgAEAIk8CVIAEFR98dUxQsCRDIkL/6g==","clear":"C4EBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":5,"minor":7,"patch":1}},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"ZKPVault","structs":{},"methods":[{"name":"create_application","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"desc":"Initialize the contract","events":[],"recommendations":{}},{"name":"submit_proof","args":[{"type":"string","name":"exam_id","desc":"The exam identifier"},{"type":"byte[32]","name":"student_hash","desc":"SHA-256 hash of the student identity (32 bytes)"},{"type":"uint64","name":"trust_score","desc":"Final trust score (0-100)"},{"type":"byte[32]","name":"proof_hash","desc":"SHA-256 hash of the proof data (32 bytes)"}],"returns":{"type":"bool","desc":"True once the proof has been accepted"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Submit exam proof for a student","events":[],"recommendations":{}},{"name":"verify_submission","args":[{"type":"string","name":"exam_id","desc":"The exam identifier"},{"type":"byte[32]","name":"student_hash","desc":"SHA-256 hash of the student identity (32 bytes)"},{"type":"uint64","name":"trust_score","desc":"Final trust score (0-100)"},{"type":"byte[32]","name":"proof_hash","desc":"SHA-256 hash of the proof data (32 bytes)"}],"returns":{"type":"bool","desc":"True if valid"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Verify that a proof submission is valid","events":[],"recommendations":{}},{"name":"get_contract_info","args":[],"returns":{"type":"string","desc":"Contract name and version"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Get contract information","events":[],"recommendations":{}}],"arcs":[22,28],"desc":"\n    ZKP-Vault Smart Contract\n    Privacy-preserving AI proctoring on Algorand\n    \n    Simplified version using global state for demo purposes\n    ","networks":{},"state":{"schema":{"global":{"ints":0,"bytes":0},"local":{"ints":0,"bytes":0}},"keys":{"global":{},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[160],"errorMessage":"Trust score cannot exceed 100"},{"pc":[126,176],"errorMessage":"invalid array length header"},{"pc":[132,182],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[139,155,189,205],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[148,198],"errorMessage":"invalid number of bytes for arc4.uint64"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDMyIDAgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weToxNQogICAgLy8gY2xhc3MgWktQVmF1bHQoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BANwogICAgcHVzaGJ5dGVzcyAweGFhOTZhNmM0IDB4NTNkMTg0ZDAgMHgyZWVlYmJiOSAvLyBtZXRob2QgInN1Ym1pdF9wcm9vZihzdHJpbmcsYnl0ZVszMl0sdWludDY0LGJ5dGVbMzJdKWJvb2wiLCBtZXRob2QgInZlcmlmeV9zdWJtaXNzaW9uKHN0cmluZyxieXRlWzMyXSx1aW50NjQsYnl0ZVszMl0pYm9vbCIsIG1ldGhvZCAiZ2V0X2NvbnRyYWN0X2luZm8oKXN0cmluZyIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIHN1Ym1pdF9wcm9vZiB2ZXJpZnlfc3VibWlzc2lvbiBtYWluX2dldF9jb250cmFjdF9pbmZvX3JvdXRlQDUKICAgIGVycgoKbWFpbl9nZXRfY29udHJhY3RfaW5mb19yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMzE1YTRiNTAyZDU2NjE3NTZjNzQyMDc2MzEyZTMwMjAyZDIwNTA3MjY5NzY2MTYzNzkyZDUwNzI2NTczNjU3Mjc2Njk2ZTY3MjA0MTQ5MjA1MDcyNmY2Mzc0NmY3MjY5NmU2NwogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9Ob09wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjE1CiAgICAvLyBjbGFzcyBaS1BWYXVsdChBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4NzUyYzNhYzAgLy8gbWV0aG9kICJjcmVhdGVfYXBwbGljYXRpb24oKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9hcHBsaWNhdGlvbl9yb3V0ZUA4CiAgICBlcnIKCm1haW5fY3JlYXRlX2FwcGxpY2F0aW9uX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5OjIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuemtwX3ZhdWx0LmNvbnRyYWN0LlpLUFZhdWx0LnN1Ym1pdF9wcm9vZltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1Ym1pdF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzIgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBsZW4KICAgIGludGNfMSAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgbGVuCiAgICBpbnRjXzEgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo0OC00OQogICAgLy8gIyBWZXJpZnkgdHJ1c3Qgc2NvcmUgaXMgdmFsaWQgKDAtMTAwKTsgVUludDY0IGlzIG5ldmVyIG5lZ2F0aXZlCiAgICAvLyBhc3NlcnQgdHJ1c3Rfc2NvcmUubmF0aXZlIDw9IDEwMCwgIlRydXN0IHNjb3JlIGNhbm5vdCBleGNlZWQgMTAwIgogICAgYnRvaQogICAgcHVzaGludCAxMDAKICAgIDw9CiAgICBhc3NlcnQgLy8gVHJ1c3Qgc2NvcmUgY2Fubm90IGV4Y2VlZCAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6MjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzU4MAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnprcF92YXVsdC5jb250cmFjdC5aS1BWYXVsdC52ZXJpZnlfc3VibWlzc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeV9zdWJtaXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3prcF92YXVsdC9jb250cmFjdC5weTo1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMiAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGxlbgogICAgaW50Y18xIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBsZW4KICAgIGludGNfMSAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvemtwX3ZhdWx0L2NvbnRyYWN0LnB5Ojc3LTc5CiAgICAvLyAjIEJhc2ljIHZhbGlkYXRpb247IGNvbWJpbmUgYW55IGZ1dHVyZSBwcmVkaWNhdGVzIHdpdGggYCZgIHNvIHRoZQogICAgLy8gIyBjaGVjayBzdGF5cyBicmFuY2hsZXNzCiAgICAvLyByZXR1cm4gYXJjNC5Cb29sKHRydXN0X3Njb3JlLm5hdGl2ZSA8PSAxMDApCiAgICBidG9pCiAgICBwdXNoaW50IDEwMAogICAgPD0KICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzIgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96a3BfdmF1bHQvY29udHJhY3QucHk6NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"byteCode":{"approval":"CyAEASAAAjEZFEQxGEEAWYIDBKqWpsQEU9GE0AQu7ru5NhoAjgMATQB/AAEAgDcVH3x1ADFaS1AtVmF1bHQgdjEuMCAtIFByaXZhY3ktUHJlc2VydmluZyBBSSBQcm9jdG9yaW5nsCJDgAR1LDrANhoAjgEAAQAiQzYaAUkkWSUITBUSRDYaAhUjEkQ2GgNJFYEIEkQ2GgQVIxJEF4FkDkSABRUffHWAsCJDNhoBSSRZJQhMFRJENhoCFSMSRDYaA0kVgQgSRDYaBBUjEkQXgWQOgAEAJE8CVIAEFR98dUxQsCJD","clear":"C4EBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":5,"minor":7,"patch":1}},"events":[],"templateVariables":{}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -72,41 +72,41 @@ export type ZkpVaultArgs = {
    */
   obj: {
     'create_application()void': Record<string, never>
-    'submit_proof(string,string,uint64,string)string': {
+    'submit_proof(string,byte[32],uint64,byte[32])bool': {
       /**
        * The exam identifier
        */
       examId: string
       /**
-       * Hashed student identity
+       * SHA-256 hash of the student identity (32 bytes)
        */
-      studentHash: string
+      studentHash: Uint8Array
       /**
        * Final trust score (0-100)
        */
       trustScore: bigint | number
       /**
-       * SHA-256 hash of the proof data
+       * SHA-256 hash of the proof data (32 bytes)
        */
-      proofHash: string
+      proofHash: Uint8Array
     }
-    'verify_submission(string,string,uint64,string)bool': {
+    'verify_submission(string,byte[32],uint64,byte[32])bool': {
       /**
        * The exam identifier
        */
       examId: string
       /**
-       * Hashed student identity
+       * SHA-256 hash of the student identity (32 bytes)
        */
-      studentHash: string
+      studentHash: Uint8Array
       /**
        * Final trust score (0-100)
        */
       trustScore: bigint | number
       /**
-       * SHA-256 hash of the proof data
+       * SHA-256 hash of the proof data (32 bytes)
        */
-      proofHash: string
+      proofHash: Uint8Array
     }
     'get_contract_info()string': Record<string, never>
   }
@@ -115,8 +115,8 @@ export type ZkpVaultArgs = {
    */
   tuple: {
     'create_application()void': []
-    'submit_proof(string,string,uint64,string)string': [examId: string, studentHash: string, trustScore: bigint | number, proofHash: string]
-    'verify_submission(string,string,uint64,string)bool': [examId: string, studentHash: string, trustScore: bigint | number, proofHash: string]
+    'submit_proof(string,byte[32],uint64,byte[32])bool': [examId: string, studentHash: Uint8Array, trustScore: bigint | number, proofHash: Uint8Array]
+    'verify_submission(string,byte[32],uint64,byte[32])bool': [examId: string, studentHash: Uint8Array, trustScore: bigint | number, proofHash: Uint8Array]
     'get_contract_info()string': []
   }
 }
@@ -126,8 +126,8 @@ export type ZkpVaultArgs = {
  */
 export type ZkpVaultReturns = {
   'create_application()void': void
-  'submit_proof(string,string,uint64,string)string': string
-  'verify_submission(string,string,uint64,string)bool': boolean
+  'submit_proof(string,byte[32],uint64,byte[32])bool': boolean
+  'verify_submission(string,byte[32],uint64,byte[32])bool': boolean
   'get_contract_info()string': string
 }
 
@@ -144,21 +144,21 @@ export type ZkpVaultTypes = {
       argsTuple: ZkpVaultArgs['tuple']['create_application()void']
       returns: ZkpVaultReturns['create_application()void']
     }>
-    & Record<'submit_proof(string,string,uint64,string)string' | 'submit_proof', {
-      argsObj: ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string']
-      argsTuple: ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']
+    & Record<'submit_proof(string,byte[32],uint64,byte[32])bool' | 'submit_proof', {
+      argsObj: ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool']
+      argsTuple: ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']
       /**
-       * Success message with transaction details
+       * True once the proof has been accepted
        */
-      returns: ZkpVaultReturns['submit_proof(string,string,uint64,string)string']
+      returns: ZkpVaultReturns['submit_proof(string,byte[32],uint64,byte[32])bool']
     }>
-    & Record<'verify_submission(string,string,uint64,string)bool' | 'verify_submission', {
-      argsObj: ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool']
-      argsTuple: ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']
+    & Record<'verify_submission(string,byte[32],uint64,byte[32])bool' | 'verify_submission', {
+      argsObj: ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool']
+      argsTuple: ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']
       /**
        * True if valid
        */
-      returns: ZkpVaultReturns['verify_submission(string,string,uint64,string)bool']
+      returns: ZkpVaultReturns['verify_submission(string,byte[32],uint64,byte[32])bool']
     }>
     & Record<'get_contract_info()string' | 'get_contract_info', {
       argsObj: ZkpVaultArgs['obj']['get_contract_info()string']
@@ -250,32 +250,32 @@ export abstract class ZkpVaultParamsFactory {
   }
 
   /**
-   * Constructs a no op call for the submit_proof(string,string,uint64,string)string ABI method
+   * Constructs a no op call for the submit_proof(string,byte[32],uint64,byte[32])bool ABI method
    *
    * Submit exam proof for a student
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static submitProof(params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string'] | ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static submitProof(params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'submit_proof(string,string,uint64,string)string' as const,
+      method: 'submit_proof(string,byte[32],uint64,byte[32])bool' as const,
       args: Array.isArray(params.args) ? params.args : [params.args.examId, params.args.studentHash, params.args.trustScore, params.args.proofHash],
     }
   }
   /**
-   * Constructs a no op call for the verify_submission(string,string,uint64,string)bool ABI method
+   * Constructs a no op call for the verify_submission(string,byte[32],uint64,byte[32])bool ABI method
    *
    * Verify that a proof submission is valid
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static verifySubmission(params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool'] | ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static verifySubmission(params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'verify_submission(string,string,uint64,string)bool' as const,
+      method: 'verify_submission(string,byte[32],uint64,byte[32])bool' as const,
       args: Array.isArray(params.args) ? params.args : [params.args.examId, params.args.studentHash, params.args.trustScore, params.args.proofHash],
     }
   }
@@ -542,26 +542,26 @@ export class ZkpVaultClient {
     },
 
     /**
-     * Makes a call to the ZKPVault smart contract using the `submit_proof(string,string,uint64,string)string` ABI method.
+     * Makes a call to the ZKPVault smart contract using the `submit_proof(string,byte[32],uint64,byte[32])bool` ABI method.
      *
      * Submit exam proof for a student
      *
      * @param params The params for the smart contract call
-     * @returns The call params: Success message with transaction details
+     * @returns The call params: True once the proof has been accepted
      */
-    submitProof: (params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string'] | ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    submitProof: (params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.params.call(ZkpVaultParamsFactory.submitProof(params))
     },
 
     /**
-     * Makes a call to the ZKPVault smart contract using the `verify_submission(string,string,uint64,string)bool` ABI method.
+     * Makes a call to the ZKPVault smart contract using the `verify_submission(string,byte[32],uint64,byte[32])bool` ABI method.
      *
      * Verify that a proof submission is valid
      *
      * @param params The params for the smart contract call
      * @returns The call params: True if valid
      */
-    verifySubmission: (params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool'] | ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    verifySubmission: (params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.params.call(ZkpVaultParamsFactory.verifySubmission(params))
     },
 
@@ -594,26 +594,26 @@ export class ZkpVaultClient {
     },
 
     /**
-     * Makes a call to the ZKPVault smart contract using the `submit_proof(string,string,uint64,string)string` ABI method.
+     * Makes a call to the ZKPVault smart contract using the `submit_proof(string,byte[32],uint64,byte[32])bool` ABI method.
      *
      * Submit exam proof for a student
      *
      * @param params The params for the smart contract call
-     * @returns The call transaction: Success message with transaction details
+     * @returns The call transaction: True once the proof has been accepted
      */
-    submitProof: (params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string'] | ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    submitProof: (params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(ZkpVaultParamsFactory.submitProof(params))
     },
 
     /**
-     * Makes a call to the ZKPVault smart contract using the `verify_submission(string,string,uint64,string)bool` ABI method.
+     * Makes a call to the ZKPVault smart contract using the `verify_submission(string,byte[32],uint64,byte[32])bool` ABI method.
      *
      * Verify that a proof submission is valid
      *
      * @param params The params for the smart contract call
      * @returns The call transaction: True if valid
      */
-    verifySubmission: (params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool'] | ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    verifySubmission: (params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(ZkpVaultParamsFactory.verifySubmission(params))
     },
 
@@ -646,29 +646,29 @@ export class ZkpVaultClient {
     },
 
     /**
-     * Makes a call to the ZKPVault smart contract using the `submit_proof(string,string,uint64,string)string` ABI method.
+     * Makes a call to the ZKPVault smart contract using the `submit_proof(string,byte[32],uint64,byte[32])bool` ABI method.
      *
      * Submit exam proof for a student
      *
      * @param params The params for the smart contract call
-     * @returns The call result: Success message with transaction details
+     * @returns The call result: True once the proof has been accepted
      */
-    submitProof: async (params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string'] | ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    submitProof: async (params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       const result = await this.appClient.send.call(ZkpVaultParamsFactory.submitProof(params))
-      return {...result, return: result.return as unknown as (undefined | ZkpVaultReturns['submit_proof(string,string,uint64,string)string'])}
+      return {...result, return: result.return as unknown as (undefined | ZkpVaultReturns['submit_proof(string,byte[32],uint64,byte[32])bool'])}
     },
 
     /**
-     * Makes a call to the ZKPVault smart contract using the `verify_submission(string,string,uint64,string)bool` ABI method.
+     * Makes a call to the ZKPVault smart contract using the `verify_submission(string,byte[32],uint64,byte[32])bool` ABI method.
      *
      * Verify that a proof submission is valid
      *
      * @param params The params for the smart contract call
      * @returns The call result: True if valid
      */
-    verifySubmission: async (params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool'] | ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    verifySubmission: async (params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       const result = await this.appClient.send.call(ZkpVaultParamsFactory.verifySubmission(params))
-      return {...result, return: result.return as unknown as (undefined | ZkpVaultReturns['verify_submission(string,string,uint64,string)bool'])}
+      return {...result, return: result.return as unknown as (undefined | ZkpVaultReturns['verify_submission(string,byte[32],uint64,byte[32])bool'])}
     },
 
     /**
@@ -709,19 +709,19 @@ export class ZkpVaultClient {
     const resultMappers: Array<undefined | ((x: ABIReturn | undefined) => any)> = []
     return {
       /**
-       * Add a submit_proof(string,string,uint64,string)string method call against the ZKPVault contract
+       * Add a submit_proof(string,byte[32],uint64,byte[32])bool method call against the ZKPVault contract
        */
-      submitProof(params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string'] | ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      submitProof(params: CallParams<ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.submitProof(params)))
-        resultMappers.push((v) => client.decodeReturnValue('submit_proof(string,string,uint64,string)string', v))
+        resultMappers.push((v) => client.decodeReturnValue('submit_proof(string,byte[32],uint64,byte[32])bool', v))
         return this
       },
       /**
-       * Add a verify_submission(string,string,uint64,string)bool method call against the ZKPVault contract
+       * Add a verify_submission(string,byte[32],uint64,byte[32])bool method call against the ZKPVault contract
        */
-      verifySubmission(params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool'] | ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      verifySubmission(params: CallParams<ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.verifySubmission(params)))
-        resultMappers.push((v) => client.decodeReturnValue('verify_submission(string,string,uint64,string)bool', v))
+        resultMappers.push((v) => client.decodeReturnValue('verify_submission(string,byte[32],uint64,byte[32])bool', v))
         return this
       },
       /**
@@ -768,7 +768,7 @@ export class ZkpVaultClient {
 }
 export type ZkpVaultComposer<TReturns extends [...any[]] = []> = {
   /**
-   * Calls the submit_proof(string,string,uint64,string)string ABI method.
+   * Calls the submit_proof(string,byte[32],uint64,byte[32])bool ABI method.
    *
    * Submit exam proof for a student
    *
@@ -776,10 +776,10 @@ export type ZkpVaultComposer<TReturns extends [...any[]] = []> = {
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  submitProof(params?: CallParams<ZkpVaultArgs['obj']['submit_proof(string,string,uint64,string)string'] | ZkpVaultArgs['tuple']['submit_proof(string,string,uint64,string)string']>): ZkpVaultComposer<[...TReturns, ZkpVaultReturns['submit_proof(string,string,uint64,string)string'] | undefined]>
+  submitProof(params?: CallParams<ZkpVaultArgs['obj']['submit_proof(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['submit_proof(string,byte[32],uint64,byte[32])bool']>): ZkpVaultComposer<[...TReturns, ZkpVaultReturns['submit_proof(string,byte[32],uint64,byte[32])bool'] | undefined]>
 
   /**
-   * Calls the verify_submission(string,string,uint64,string)bool ABI method.
+   * Calls the verify_submission(string,byte[32],uint64,byte[32])bool ABI method.
    *
    * Verify that a proof submission is valid
    *
@@ -787,7 +787,7 @@ export type ZkpVaultComposer<TReturns extends [...any[]] = []> = {
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  verifySubmission(params?: CallParams<ZkpVaultArgs['obj']['verify_submission(string,string,uint64,string)bool'] | ZkpVaultArgs['tuple']['verify_submission(string,string,uint64,string)bool']>): ZkpVaultComposer<[...TReturns, ZkpVaultReturns['verify_submission(string,string,uint64,string)bool'] | undefined]>
+  verifySubmission(params?: CallParams<ZkpVaultArgs['obj']['verify_submission(string,byte[32],uint64,byte[32])bool'] | ZkpVaultArgs['tuple']['verify_submission(string,byte[32],uint64,byte[32])bool']>): ZkpVaultComposer<[...TReturns, ZkpVaultReturns['verify_submission(string,byte[32],uint64,byte[32])bool'] | undefined]>
 
   /**
    * Calls the get_contract_info()string ABI method.
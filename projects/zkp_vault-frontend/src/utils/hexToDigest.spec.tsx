@@ -0,0 +1,20 @@
+import { hexToDigest } from './hexToDigest'
+
+describe('hexToDigest', () => {
+  it('should decode a 0x-prefixed digest into 32 raw bytes', () => {
+    const result = hexToDigest('0x' + '00ff'.repeat(16))
+    expect(result).toHaveLength(32)
+    expect(result[0]).toBe(0x00)
+    expect(result[1]).toBe(0xff)
+  })
+
+  it('should decode a digest without the 0x prefix', () => {
+    const result = hexToDigest('ab'.repeat(32))
+    expect(Array.from(result)).toEqual(new Array(32).fill(0xab))
+  })
+
+  it('should throw when the digest is not 32 bytes of hex', () => {
+    expect(() => hexToDigest('0x1234')).toThrow()
+    expect(() => hexToDigest('zz'.repeat(32))).toThrow()
+  })
+})
@@ -0,0 +1,7 @@
+export function hexToDigest(hex: string): Uint8Array {
+  const digest = hex.startsWith('0x') ? hex.slice(2) : hex
+  if (!/^[0-9a-fA-F]{64}$/.test(digest)) {
+    throw new Error(`Expected a 32-byte hex digest, got '${hex}'`)
+  }
+  return Uint8Array.from(digest.match(/../g) ?? [], (byte) => parseInt(byte, 16))
+}